@@ -2,11 +2,47 @@
 #  @brief implementation for abstract base class for color themes.
 
 from typing import Union
-from abc import ABC, abstractmethod
-from enum import Enum, EnumMeta, auto
+from abc import ABC, ABCMeta, abstractmethod
+from functools import lru_cache
+from array import array
+from enum import Enum, EnumMeta
 
 from utils.color import Color
 
+## @class cached_classproperty
+#  @brief Class level property, computed on first access and then stored in the class.
+#
+#  Used for theme attributes that are expensive to build (overlays and states), so they are 
+#  created only when the UI first needs them instead of when the theme module is imported.
+#  The value is always built from the class that defines the attribute, as a class body 
+#  attribute would be, and inherited as is by subclasses, whichever class is read first. After 
+#  the first access, it replaces the descriptor in the defining class, so following reads are 
+#  plain class attribute lookups.
+class cached_classproperty:
+    ## @brief Constructor for wrapping the function that computes the value
+    #
+    #  @param factory A function receiving the owner class and returning the attribute value
+    def __init__(self, factory):
+        self._factory = factory
+        self._name = factory.__name__
+        self._owner = None
+        self.__doc__ = factory.__doc__
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+        self._owner = owner
+    
+    def __get__(self, instance, owner):
+        # ABCMeta looks up the inherited abstract names while still creating the class, building
+        # the value there would bring the work back to import time.
+        if (isinstance(owner, ABCMeta) and "__abstractmethods__" not in owner.__dict__):
+            return self
+        
+        value = self._factory(self._owner)
+        setattr(self._owner, self._name, value)
+        
+        return value
+
 ## @ingroup abc
 #  @class BaseTheme
 #  @brief Abstract base class for color themes.
@@ -22,10 +58,11 @@ class BaseTheme(ABC):
     #
     #   
     #  When light text appears on dark backgrounds it should use opacity levels that describe its use.
+    #  The values are pinned, so themes can index their emphasis colors with them.
     class EmphasisLevel(Enum):
-        HIGH = auto()
-        MEDIUM = auto()
-        DISABLED = auto()        
+        HIGH = 0
+        MEDIUM = 1
+        DISABLED = 2
         
     ##  @brief Main color for the color theme
     @property
@@ -70,36 +107,36 @@ class BaseTheme(ABC):
     
     ## @brief Define a new color based on the outline value alpha channel, and the input color
     # 
-    # @params color A hexadecimal string that represents a color value 
-    # @return A hexadecimal string that represents the new color value with the outline percentage 
+    # @params color A Color that represents a color value 
+    # @return A Color that represents the new color value with the outline percentage 
     # aplied
     @staticmethod
     @abstractmethod
-    def outline(self, color: str) -> str:
+    def outline(color: Color) -> Color:
         pass
     
     ## Define a new color based on the surface overlay value alpha channel, and the input color.
     #  Must be used for chips and text fields.
     #
-    #  @params color A hexadecimal string that represents a color value 
-    #  @return A hexadecimal string that represents the new color value with the surface overlay 
+    #  @params color A Color that represents a color value 
+    #  @return A Color that represents the new color value with the surface overlay 
     #  percentage aplied
     @staticmethod
     @abstractmethod
-    def surface_overlay(self, color: str) -> str:
+    def surface_overlay(color: Color) -> Color:
         pass
         
     
     ## @brief Based on the emphasis level, returns a different hexadecimal color with the emphasis level  
-    @staticmethod
+    @classmethod
     @abstractmethod
-    def emphasis_on_surface(self, emphasis_level: EmphasisLevel) -> str:
+    def emphasis_on_surface(cls, color: Color, emphasis_level: EmphasisLevel) -> Color:
         pass
     
     ## @brief Based on the emphasis level, returns a different hexadecimal blended color with the emphasis level  
-    @staticmethod
+    @classmethod
     @abstractmethod
-    def emphasis_on_primary(self, emphasis_level : EmphasisLevel) -> str:
+    def emphasis_on_primary(cls, color: Color, emphasis_level : EmphasisLevel) -> Color:
         pass
     
 
@@ -109,17 +146,32 @@ class BaseTheme(ABC):
 #  To express elevation and space in an environment with a wider range of depth. Knowing this,
 #  the background will have 0dp elevation surface overlay, meaning the lowest level of depth. 
 class ElevationOverlay:            
+    ## @brief Contrast color opacity for every elevation level, as (dp, alpha) pairs
+    ALPHAS = ((1, 0.05), (2, 0.07), (3, 0.08), (4, 0.09), (6, 0.11), (8, 0.12),
+              (12, 0.14), (16, 0.15), (24, 0.16))
+    
+    ## @brief Position of every elevation level in the channel arrays
+    _INDEX = {n: i for i, (n, _) in enumerate(ALPHAS)}
+
     ## @brief Constructor for instantiate a new elevation overlay based on the given theme surface color
     #
+    #  Every level is the contrast color composited over the surface with the Porter-Duff "over"
+    #  operator (surface * (1 - alpha) + contrast * alpha). The channels are read once and all
+    #  levels are computed in a single pass, without going through hex strings and 
+    #  @ref Color.blend_list.
+    #
+    #  The levels are stored as one unsigned byte array per channel, the hexadecimal strings
+    #  are only formatted if @ref get_all_members is called.
+    #
     #  @param surface  Color class that indicates the surface color for the theme 
     #  @param contrast Color class that indicates the contrast color for the theme
     def __init__(self, surface: Color, contrast: Color):
-        alphas = [(1,0.05),(2,0.07), (3,0.08), (4, 0.09), (6, 0.11), (8, 0.12), 
-                            (12, 0.14), (16, 0.15), (24, 0.16)]
-        self.members = {
-            f"dp{n:02d}": str(Color.blend_list([surface, [contrast.r, contrast.g, contrast.b, a]]))
-            for n,a in alphas                
-        }
+        sr, sg, sb = surface.rgb
+        cr, cg, cb = contrast.rgb
+        self._r = array("B", [round(sr + (cr - sr) * a) for _, a in self.ALPHAS])
+        self._g = array("B", [round(sg + (cg - sg) * a) for _, a in self.ALPHAS])
+        self._b = array("B", [round(sb + (cb - sb) * a) for _, a in self.ALPHAS])
+        self._members = None
         
     ## @brief Method to retrieve the required overlay color for a given level
     #
@@ -129,15 +181,32 @@ class ElevationOverlay:
     #  @exception ValueError Raised if the number is out of the list of levels, 
     def get_elevation(self, overlay_level: int) -> Color:
         try:
-            return self.members[f"dp{overlay_level:02d}"]
-        except:
-            raise ValueError(f"Expected a integer in {self.members.keys()}, got dp{overlay_level}")
+            i = self._INDEX[overlay_level]
+        except KeyError:
+            raise ValueError(f"Expected a integer in {list(self._INDEX)}, got {overlay_level}") from None
+        
+        return Color._from_rgb(self._r[i], self._g[i], self._b[i])
     
     ## @brief Method to retrieve all overlay levels
     #
-    #  @return A dictionary of [level: Color] 
-    def get_all_members(self) -> dict[int, Color]:
-        return self.members
+    #  @return A dictionary of [level: hexadecimal color], with levels named "dp01" to "dp24"
+    def get_all_members(self) -> dict[str, str]:
+        if (self._members is None):
+            # Interleave the channels and format all levels with a single bytes.hex() call
+            rgb = bytearray(3 * len(self._INDEX))
+            rgb[0::3], rgb[1::3], rgb[2::3] = self._r, self._g, self._b
+            digits = rgb.hex()
+            self._members = {
+                f"dp{n:02d}": "#" + digits[6 * i : 6 * i + 6]
+                for n, i in self._INDEX.items()
+            }
+        
+        return self._members
+    
+    ## @brief All overlay levels, read-only, see @ref get_all_members
+    @property
+    def members(self) -> dict[str, str]:
+        return self.get_all_members()
     
 ## @ingroup abc
 #  @class BaseColorEnum
@@ -151,6 +220,11 @@ class BaseColorEnum(ABC, EnumMeta):
 #  @brief Standard interface for UI states. 
 #
 #  Define all states that components can have, and sets standard interactions for every one.
+#  Every state color is composited over the component color with @ref Color.over.
+#
+#  Components are painted with a small, closed set of colors, so the composites of opaque colors
+#  are memoized by the state channels and the hex value. Only the channel tuples are cached, every
+#  call returns a new Color that the caller is free to change.
 class States:    
     def __init__(self, hover, focus, pressed, dragged, selected):
         self._hover = hover
@@ -160,16 +234,40 @@ class States:
         self._selected = selected
     
     def hover(self, color: Union[str, Color, list]) -> Color:
-        return Color.blend_list([self._hover, color])
+        return States._composite(self._hover, color)
     
     def focus(self, color: Union[str, Color, list]) -> Color:   
-        return Color.blend_list([self._focus, color])
+        return States._composite(self._focus, color)
     
     def pressed(self, color: Union[str, Color, list]) -> Color:     
-        return Color.blend_list([self._pressed, color])
+        return States._composite(self._pressed, color)
     
     def dragged(self, color: Union[str, Color, list]) -> Color:     
-        return Color.blend_list([self._dragged, color])
+        return States._composite(self._dragged, color)
     
     def selected(self, color: Union[str, Color, list]) -> Color:     
-        return Color.blend_list([self._selected, color])
\ No newline at end of file
+        return States._composite(self._selected, color)
+    
+    ## @brief Composite the state color over color, going through the cache for opaque colors
+    @staticmethod
+    def _composite(state: Color, color: Union[str, Color, list]) -> Color:
+        if (isinstance(color, Color)):
+            if (color.a != 1):
+                return state.over(color)
+            color = color.hex
+        elif (not isinstance(color, str)):
+            return state.over(color)
+        
+        return Color._from_rgb(*States._over_hex((state.r, state.g, state.b, state.a), color))
+    
+    ## @brief Memoized composite of a (R, G, B, A) state over a hexadecimal color.
+    #
+    #  The key holds the state values, not the instance, so changing a state color never reads a 
+    #  stale entry.
+    #
+    #  @return A tuple in the format (R, G, B, A).
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _over_hex(state_rgba: tuple, hex_color: str) -> tuple:
+        composite = Color._from_rgb(*state_rgba).over(hex_color)
+        return composite.r, composite.g, composite.b, composite.a
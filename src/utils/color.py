@@ -2,93 +2,139 @@
 #  @brief implementation class for colors
 
 from typing import Union
-from math import ceil
-import re
+from functools import lru_cache
+
+## @brief Mask that keeps the R channel (moved to bit 32) and the B channel of a packed color
+_RB_LANES = 0xFF000000FF
+
+## @brief Smallest all-hexadecimal color_list that @ref Color.blend_list hands over to NumPy
+_NUMPY_MIN_COLORS = 32
 
 ## @ingroup utils
 #  @class Color
 #  @brief implementation for color manipulation.
 #
 #  All colors are RGB coded, so do not have trasparency values, even knowing that alpha values can be 
-#  used, they only apply to the current color, not overlayed colors. 
+#  used, they only apply to the current color, not overlayed colors. The alpha value is kept, with 
+#  the channels premultiplied by it, so the color can be composited with @ref over. 
 class Color:          
+    __slots__ = ("_r", "_g", "_b", "_a", "_hex")
+    
     ## @brief Constructor for creating a color.
     #    
-    #  @param color A string representing a hexadecimal color (e.g., "#RRGGBB" or "RRGGBB)
-    #  or a list representing a rgba color (e.g, [r,g,b,a]).
-    #  @exception TypeError  Raised if color is not a list nor string.
+    #  The color can be given as a single value or as its channels (e.g., Color(r, g, b, a)).
+    #
+    #  @param color A string representing a hexadecimal color (e.g., "#RRGGBB", "RRGGBB" or "#RGB")
+    #  or a list or tuple representing a rgba color (e.g, [r,g,b,a]), or the r channel.
+    #  @param channels The remaining g, b and optional a channels, when color is the r channel.
+    #  @exception TypeError  Raised if color is not a list, tuple nor string.
     #  @exception ValueError Raised if color is a list and leght != 4 or != 3.
     #  @exception ValueError Raised if color is a list and alpha value in not between ]0,1[.
     #  @exception ValueError Raised if color is a string and does not match the "#RRGGBB" or "RRGGBB"
     #  strings or are not hexadecimal values.
-    def __init__(self, color: Union[list, str]) -> None:
-        if (type(color) is list):
-            self._rgb = self.rgba_to_rgb(color)
-            self._hex = self.rgba_to_hex(color)
-        elif (type(color) is str):
-            self._rgb = self.hex_to_rgb(color)
+    def __init__(self, color: Union[list, tuple, str, int], *channels: Union[int, float]) -> None:
+        if (channels):
+            color = [color, *channels]
+        
+        if (isinstance(color, (list, tuple))):
+            r, g, b, self._a = self._normalize_rgba(color)
+            self._r, self._g, self._b = self._premultiply(r, g, b, self._a)
+            self._hex = None
+        elif (isinstance(color, str)):
+            self._r, self._g, self._b = self.hex_to_rgb(color)
             self._hex = color
+            self._a = 1
         else:
-            raise TypeError(f"Expected parameter color type: str, list[int]. Got {type(color)}")
-        
-        self._r = self.rgb[0]
-        self._g = self.rgb[1]
-        self._b = self.rgb[2]
+            raise TypeError(f"Expected parameter color type: str, list[int] or tuple[int]. Got {type(color)}")
     
     ## @brief r channel in decimal value
+    #
+    #  The r, g and b channels are the stored values of the color. Setting one of them only 
+    #  updates that channel, keeping the others, and makes the color opaque (alpha 1), as the 
+    #  stored channels are then taken as they are instead of premultiplied.
+    #
+    #  @exception TypeError  Raised if the new value is not a number.
+    #  @exception ValueError Raised if the new value is not between [0,255].
     @property
     def r(self) -> int:
         return self._r
     
     @r.setter
-    def r(self, new_value: int) -> None:
-        new_color = [new_value, self.rgb[1], self.rgb[2]]
-        
-        self.__dict__.update(Color(new_color).__dict__)
+    def r(self, new_value: Union[int, float]) -> None:
+        self._r = self._check_channel(new_value)
+        self._a = 1
+        self._hex = None
     
     @property
     def g(self) -> int:
         return self._g
     
     @g.setter
-    def g(self, new_value: int) -> None:
-        new_color = [self.rgb[0], new_value, self.rgb[2]]
-        
-        self.__dict__.update(Color(new_color).__dict__)
+    def g(self, new_value: Union[int, float]) -> None:
+        self._g = self._check_channel(new_value)
+        self._a = 1
+        self._hex = None
     
     @property
     def b(self) -> int:
         return self._b
     
     @b.setter
-    def b(self, new_value: int) -> None:
-        new_color = [self.rgb[0], self.rgb[1], new_value]
-        
-        self.__dict__.update(Color(new_color).__dict__)
+    def b(self, new_value: Union[int, float]) -> None:
+        self._b = self._check_channel(new_value)
+        self._a = 1
+        self._hex = None
     
-    ## @brief A RGB list (e.g., [r,g,b]) coded value color 
+    ## @brief Alpha value, between [0,1], the r, g and b channels are premultiplied by
+    @property
+    def a(self) -> float:
+        return self._a
+    
+    ## @brief A RGB tuple (e.g., (r,g,b)) coded value color 
     #  
     #  @exception ValueError Raised if rgba_color leght != 4.
     #  @exception ValueError Raised if alpha value in not between ]0,1[.
     @property
-    def rgb(self) -> list:
-        return self._rgb
+    def rgb(self) -> tuple:
+        return (self._r, self._g, self._b)
     
     @rgb.setter
     def rgb(self, new_value: list) -> None:       
-        self.__dict__.update(Color(new_value).__dict__)
+        r, g, b, self._a = self._normalize_rgba(new_value)
+        self._r, self._g, self._b = self._premultiply(r, g, b, self._a)
+        self._hex = None
         
     ## @brief A hexadecimal string (e.g. "#RRGGBB") coded value color  
     #
+    #  For colors created from channels, it is only formatted on first access.
+    #
     #  @exception ValueError Raised if hex_color does not match the "#RRGGBB" or "RRGGBB" strings
     #  or are not hexadecimal values.
     @property 
     def hex(self) -> str:
+        if (self._hex is None):
+            self._hex = "#" + bytes((self._r, self._g, self._b)).hex()
+        
         return self._hex 
     
     @hex.setter
     def hex(self, new_value: str) -> None:       
-        self.__dict__.update(Color(new_value).__dict__)
+        self._r, self._g, self._b = self.hex_to_rgb(new_value)
+        self._hex = new_value
+        self._a = 1
+    
+    ## @brief Create a color from channels that are already valid, skipping __init__.
+    #
+    #  For results computed inside the class (blends, composites) or restored from cached values,
+    #  whose channels are integers between [0,255], already premultiplied by a. The hex value is 
+    #  still formatted lazily.
+    #
+    #  @return A new Color instance, opaque unless a is given.
+    @classmethod
+    def _from_rgb(cls, r: int, g: int, b: int, a: float = 1) -> 'Color':
+        color = cls.__new__(cls)
+        color._r, color._g, color._b, color._a, color._hex = r, g, b, a, None
+        return color
     
     ## @brief define a human-readable string representation of the color.
     #  
@@ -102,27 +148,11 @@ class Color:
     #  @param rgba_color A string with the rgba color value.
     #  @return A Color with the color in hexadecimal format "#RRGGBB".
     #  @exception ValueError Raised if rgba_color leght != 4 or != 3.
-    #  @exception ValueError Raised if any R,G or B channel value is not between ]0,256].
+    #  @exception ValueError Raised if any R,G or B channel value is not between [0,255].
     #  @exception ValueError Raised if alpha value in not between ]0,1[.
     @staticmethod
     def rgba_to_rgb(rgba_color: list) -> list[int]:
-        if (len(rgba_color) != 3 and len(rgba_color) != 4):
-            raise ValueError(f"Expected a list of length 3 ou 4 , got length {len(rgba_color)}")
-        if (len(rgba_color) == 4):
-            if (rgba_color[3] < 0 or rgba_color[3] > 1):
-                raise ValueError(f"Invalid alpha value. Expected should be between ]0,1[")
-        for i in range(3):
-            if (rgba_color[i] < 0 or rgba_color[i] > 255):
-                raise ValueError(f"")
-        
-        if (len(rgba_color) == 3):
-            rgba_color.append(1)
-                   
-        r = ceil(rgba_color[0] * rgba_color[3])
-        g = ceil(rgba_color[1] * rgba_color[3])
-        b = ceil(rgba_color[2] * rgba_color[3])
-
-        return [r, g, b]
+        return list(Color._premultiply(*Color._normalize_rgba(rgba_color)))
     
     ## @brief Static method to convert a rgba list color value (e.g., (r, g, b, a)) to a hexadecimal
     #  value (e.g., "#RRGGBB").
@@ -130,48 +160,132 @@ class Color:
     #  @param rgba_color A string with the rgba color value.
     #  @return A Color with the color in hexadecimal format "#RRGGBB".
     #  @exception ValueError Raised if rgba_color leght != 4 or != 3.
-    #  @exception ValueError Raised if any R,G or B channel value is not between ]0,256].
+    #  @exception ValueError Raised if any R,G or B channel value is not between [0,255].
     #  @exception ValueError Raised if alpha value in not between ]0,1[.
     @staticmethod
     def rgba_to_hex(rgba_color: list) -> str:
-        if (len(rgba_color) != 3 and len(rgba_color) != 4):
-            raise ValueError(f"Expected a list of length 3 ou 4 , got length {len(rgba_color)}")
-        if (len(rgba_color) == 4):
-            if (rgba_color[3] < 0 or rgba_color[3] > 1):
-                raise ValueError(f"Invalid alpha value. Expected should be between ]0,1[")
-        for i in range(3):
-            if (rgba_color[i] < 0 or rgba_color[i] > 255):
-                raise ValueError(f"")
-            
-        if (len(rgba_color) == 3):
-            rgba_color.append(1)
+        return "#" + bytes(Color._premultiply(*Color._normalize_rgba(rgba_color))).hex()
+    
+    ## @brief Static method to validate a rgba list color value, without changing it.
+    #
+    #  Channels may be given as floats, they are rounded to the nearest integer (halves up) once 
+    #  here, so the premultiplication and packing only ever see integers.
+    #
+    #  @param rgba_color A list with the rgba or rgb color value.
+    #  @return A tuple in the format (R, G, B, A), with integer channels and A = 1 when not given.
+    #  @exception ValueError Raised if rgba_color leght != 4 or != 3.
+    #  @exception ValueError Raised if any R,G or B channel value is not between [0,255].
+    #  @exception ValueError Raised if alpha value in not between ]0,1[.
+    @staticmethod
+    def _normalize_rgba(rgba_color: list) -> tuple:
+        n = len(rgba_color)
+        if (n != 3 and n != 4):
+            raise ValueError(f"Expected a list of length 3 ou 4 , got length {n}")
+        a = rgba_color[3] if n == 4 else 1
+        if (a < 0 or a > 1):
+            raise ValueError(f"Invalid alpha value. Expected should be between ]0,1[")
+        r, g, b = rgba_color[0], rgba_color[1], rgba_color[2]
+        if (not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255)):
+            raise ValueError(f"Expected channel values between [0,255], got {list(rgba_color[:3])}")
         
-        r = hex(ceil(rgba_color[0] * rgba_color[3]))[2:].zfill(2)
-        g = hex(ceil(rgba_color[1] * rgba_color[3]))[2:].zfill(2)
-        b = hex(ceil(rgba_color[2] * rgba_color[3]))[2:].zfill(2)
+        return int(r + 0.5), int(g + 0.5), int(b + 0.5), a
+    
+    ## @brief Static method to validate a single channel value given to the r, g or b setters.
+    #
+    #  Float values are rounded to the nearest integer (halves up), as in @ref _normalize_rgba.
+    #
+    #  @return The channel value, as an integer.
+    #  @exception TypeError  Raised if channel is not a number.
+    #  @exception ValueError Raised if channel is not between [0,255].
+    @staticmethod
+    def _check_channel(channel: Union[int, float]) -> int:
+        if (not isinstance(channel, (int, float))):
+            raise TypeError(f"Expected a numeric channel value, got {type(channel)}")
+        if (channel < 0 or channel > 255):
+            raise ValueError(f"Expected a channel value between [0,255], got {channel}")
+        
+        return int(channel + 0.5)
+    
+    ## @brief Static method to premultiply the channels of a validated color by its alpha.
+    #
+    #  Uses Blinn's 8-bit fixed point product: c * a / 255, rounded, with integers only. Opaque
+    #  colors, the common case, are returned untouched.
+    #
+    #  @return A tuple in the format (R, G, B).
+    @staticmethod
+    def _premultiply(r: int, g: int, b: int, a: float) -> tuple:
+        if (a == 1):
+            return r, g, b
+        
+        alpha = int(a * 255 + 0.5)
+        r = r * alpha + 0x80
+        g = g * alpha + 0x80
+        b = b * alpha + 0x80
 
-        return f"#{r}{g}{b}"
+        return (((r >> 8) + r) >> 8, ((g >> 8) + g) >> 8, ((b >> 8) + b) >> 8)
     
-    ## @brief Static method to convert a hexadecimal color string (e.g., "#RRGGBB" or "RRGGBB") 
-    #  to an RGB tuple (R, G, B).
+    ## @brief Static method to convert a hexadecimal color string (e.g., "#RRGGBB", "RRGGBB" or 
+    #  the shorthand "#RGB") to an RGB tuple (R, G, B).
+    #
+    #  The string is decoded in a single pass by bytes.fromhex, which also validates it.
+    #  Results are memoized, as themes keep converting the same palette colors.
     #
     #  @param hex_color A string with the hexadecimal color value.
-    #  @return A Color in the format (R, G, B).
-    #  @exception ValueError Raised if hex_color does not match the "#RRGGBB" or "RRGGBB" strings
-    #  or are not hexadecimal values.
+    #  @return A tuple in the format (R, G, B).
+    #  @exception ValueError Raised if hex_color does not match the "#RRGGBB", "RRGGBB", "#RGB" or
+    #  "RGB" strings or are not hexadecimal values.
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def hex_to_rgb(hex_color: str) -> tuple:
+        return tuple(Color._hex_to_bytes(hex_color))
+    
+    ## @brief Static method to convert a hexadecimal color string to a packed 0xRRGGBB integer.
+    #
+    #  @param hex_color A string with the hexadecimal color value.
+    #  @return An integer with the R, G and B channels in its 3 lower bytes.
+    #  @exception ValueError Raised if hex_color is not a valid hexadecimal color, see @ref hex_to_rgb.
     @staticmethod
-    def hex_to_rgb(hex_color: str) -> list:
-        hex_color = hex_color.lstrip("#")
-        if (not re.match(r"^(?:[0-9a-fA-F]{2}){3}$", hex_color)):
+    @lru_cache(maxsize=1024)
+    def _hex_to_packed(hex_color: str) -> int:
+        return int.from_bytes(Color._hex_to_bytes(hex_color), "big")
+    
+    ## @brief Static method to decode a hexadecimal color string to its 3 channel bytes.
+    #
+    #  @param hex_color A string with the hexadecimal color value.
+    #  @return A bytes object with the R, G and B channels.
+    #  @exception ValueError Raised if hex_color is not a valid hexadecimal color, see @ref hex_to_rgb.
+    @staticmethod
+    def _hex_to_bytes(hex_color: str) -> bytes:
+        digits = hex_color[1:] if hex_color[:1] == "#" else hex_color
+        if (len(digits) == 3):
+            digits = digits[0] * 2 + digits[1] * 2 + digits[2] * 2
+        
+        # bytes.fromhex skips whitespace, so 6 digits must decode to exactly 3 bytes
+        try:
+            rgb = bytes.fromhex(digits) if len(digits) == 6 else b""
+        except ValueError:
+            rgb = b""
+        if (len(rgb) != 3):
             raise ValueError(f"Hexadecimal color value expected, instead got {hex_color}")
 
-        offset = len(hex_color) // 3
-
-        r = int(hex_color[0        : offset  ], 16)
-        g = int(hex_color[offset   : offset*2], 16)
-        b = int(hex_color[offset*2 : offset*3], 16)
-
-        return [r, g, b]
+        return rgb
+    
+    ## @brief Static method to convert any accepted color value to a packed 0xRRGGBB integer.
+    #
+    #  @param color A Color instance, a hexadecimal string or a rgba list or tuple.
+    #  @return An integer with the R, G and B channels in its 3 lower bytes.
+    #  @exception TypeError Raised if color is not a: class Color, a list, tuple or string.
+    @staticmethod
+    def _to_packed(color: Union['Color', str, list, tuple]) -> int:
+        if (isinstance(color, Color)):
+            return (color._r << 16) | (color._g << 8) | color._b
+        elif (isinstance(color, (list, tuple))):
+            r, g, b = Color.rgba_to_rgb(color)
+            return (r << 16) | (g << 8) | b
+        elif (isinstance(color, str)):
+            return Color._hex_to_packed(color)
+        
+        raise TypeError(f"Expected type: Color, list, tuple or string. Got {type(color)}")
     
     ## @brief Create a blended color from multiple colors in the color_list.
     #
@@ -180,51 +294,159 @@ class Color:
     #  The list can contain:
     #   - Color class instances;
     #   - hexadecimal string representing a color value;
-    #   - A list with lenght of 3 or 4 (for alpha values).
+    #   - A list or tuple with lenght of 3 or 4 (for alpha values).
     #
     #  @param color_list A list containing all hexadecimal colors to be added.
     #  @return A new Color instance representing the final blended color.
     #  @exception ValueError Raised if color_list leght == 0.
-    #  @exception TypeError  Raised if any item on a list is not a: class Color, a list or string.
+    #  @exception TypeError  Raised if any item on a list is not a: class Color, a list, tuple or string.
     @staticmethod
     def blend_list(color_list: list) -> 'Color':
-        if (len(color_list) == 0):
-            raise ValueError(f"Expected at least 1 color, got length {len(color_list)}")
-        
-        new_r = 0
-        new_g = 0
-        new_b = 0
-        for i, color in enumerate(color_list):
-            rgb_color = ""
-            if (isinstance(color, Color)):
-                rgb_color = color.rgb
-            elif (isinstance(color, list)):
-                rgb_color = Color.rgba_to_rgb(color)
-            elif (isinstance(color, str)):
-                rgb_color = Color.hex_to_rgb(color)
-            else:
-                raise TypeError(f"Expected type: Color, list or string. Got {type(color)}")
-            new_r += rgb_color[0]
-            new_g += rgb_color[1]
-            new_b += rgb_color[2]
+        n = len(color_list)
+        if (n == 0):
+            raise ValueError(f"Expected at least 1 color, got length {n}")
+        
+        if (n == 2):
+            return Color.blend2(color_list[0], color_list[1])
+        
+        if (n >= _NUMPY_MIN_COLORS and all(isinstance(color, str) for color in color_list)):
+            blended = Color._blend_hex_numpy(color_list)
+            if (blended is not None):
+                return blended
+        
+        # Colors are summed packed as integers: R and B share one accumulator (R lane spread to 
+        # bit 32 so B sums never carry into it) and G is masked in place, two adds per color.
+        sum_rb = 0
+        sum_g = 0
+        for color in color_list:
+            packed = Color._to_packed(color)
+            sum_rb += (packed | packed << 16) & _RB_LANES
+            sum_g += packed & 0x00FF00
             
-        new_r = ceil(new_r / len(color_list))
-        new_g = ceil(new_g / len(color_list))
-        new_b = ceil(new_b / len(color_list))
+        # Rounding up with integer division, (x + n - 1) // n == ceil(x / n) without going through floats
+        new_r = ((sum_rb >> 32) + n - 1) // n
+        new_g = ((sum_g >> 8) + n - 1) // n
+        new_b = ((sum_rb & 0xFFFFFFFF) + n - 1) // n
         
-        return Color([new_r, new_g, new_b])
+        return Color._from_rgb(new_r, new_g, new_b)
+    
+    ## @brief Import NumPy once, on first use.
+    #
+    #  NumPy is optional: the module lookup (or the failed import) is cached so callers can probe
+    #  for it on every call at no cost.
+    #
+    #  @return The numpy module, or None if it is not installed.
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _numpy():
+        try:
+            import numpy
+        except ImportError:
+            return None
+        return numpy
+    
+    ## @brief Mean of many hexadecimal colors computed with NumPy.
+    #
+    #  The strings are decoded (through the @ref hex_to_rgb cache) into one contiguous buffer that
+    #  NumPy views as an (N, 3) uint8 array and sums per channel. Sums are kept as integers so the
+    #  rounding up matches the pure Python loop of @ref blend_list exactly.
+    #
+    #  @param color_list A list of hexadecimal strings.
+    #  @return A new Color instance, or None if NumPy is not available.
+    #  @exception ValueError Raised if any item is not a valid hexadecimal color.
+    @staticmethod
+    def _blend_hex_numpy(color_list: list) -> Union['Color', None]:
+        np = Color._numpy()
+        if (np is None):
+            return None
+        
+        raw = b"".join(map(bytes, map(Color.hex_to_rgb, color_list)))
+        sums = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).sum(axis=0, dtype=np.int64)
+        n = len(color_list)
+        
+        return Color._from_rgb(*[(int(total) + n - 1) // n for total in sums])
+    
+    ## @brief Create a blended color from exactly two colors.
+    #
+    #  Specialized @ref blend_list for the common pairwise case (states, overlays, emphasis). The 
+    #  two colors are packed as integers and all channels are averaged at once, rounding up, with 
+    #  ceil((x + y) / 2) == (x | y) - ((x ^ y) >> 1) applied per byte; the mask drops the bit that
+    #  would shift into the lower channel.
+    #
+    #  @param first A Color, hexadecimal string or rgba list or tuple.
+    #  @param second A Color, hexadecimal string or rgba list or tuple.
+    #  @return A new Color instance representing the final blended color.
+    #  @exception TypeError Raised if any color is not a: class Color, a list, tuple or string.
+    @staticmethod
+    def blend2(first: Union['Color', str, list, tuple], second: Union['Color', str, list, tuple]) -> 'Color':
+        first = Color._to_packed(first)
+        second = Color._to_packed(second)
+        blended = (first | second) - (((first ^ second) & 0xFEFEFE) >> 1)
+        
+        return Color._from_rgb(blended >> 16, (blended >> 8) & 0xFF, blended & 0xFF)
     
     ## @brief Create a blended color.
     #
-    #  @param other A Color to be added.
+    #  @param other A Color, hexadecimal string or rgba list or tuple to be added.
     #  @param inplace If True, update the self instance values
     #  @return A string with the final blended color in hexadecimal format "#RRGGBB".
-    #  @exception ValueError Raised if color_list leght == 0.
-    #  @exception TypeError  Raised if any item on a list is not a class Color.
-    def blend(self, other: Union['Color', str, list], inplace: bool = False) -> 'Color':
-        blended = Color.blend_list([self, other])
+    #  @exception TypeError  Raised if other is not a: class Color, a list, tuple or string.
+    def blend(self, other: Union['Color', str, list, tuple], inplace: bool = False) -> 'Color':
+        if (not isinstance(other, Color)):
+            other = Color(other)
+        
+        # Both channels are already decoded: average them rounding up, no packing or parsing
+        r = (self._r + other._r + 1) >> 1
+        g = (self._g + other._g + 1) >> 1
+        b = (self._b + other._b + 1) >> 1
+        
         if (inplace == True):
-            self.__dict__.update(blended.__dict__)
+            self._r, self._g, self._b, self._a, self._hex = r, g, b, 1, None
             return self
-                    
-        return blended
+        
+        return Color._from_rgb(r, g, b)
+    
+    ## @brief Composite the color over a background color, using the Porter-Duff "over" operator.
+    #
+    #  As the channels are premultiplied by alpha, each resulting channel is 
+    #  c + (1 - a) * c_background, with a single (1 - a) factor per blend, and the resulting alpha
+    #  is a + (1 - a) * a_background.
+    #
+    #  @param background A Color, hexadecimal string or rgba list or tuple to be placed under the color.
+    #  @return A new Color instance with the composited color.
+    #  @exception TypeError Raised if background is not a: class Color, a list, tuple or string.
+    def over(self, background: Union['Color', str, list, tuple]) -> 'Color':
+        if (not isinstance(background, Color)):
+            background = Color(background)
+        
+        k = 1 - self._a
+        return Color._from_rgb(min(255, round(self._r + k * background._r)),
+                               min(255, round(self._g + k * background._g)),
+                               min(255, round(self._b + k * background._b)),
+                               self._a + k * background._a)
+    
+    ## @brief Create a CSS color-mix() expression of the color with another one.
+    #
+    #  Lets style sinks that blend natively (e.g., CSS or Qt style sheets) do the mixing at paint 
+    #  time instead of receiving an already blended hex value. When percentage is not given, the 
+    #  color alpha is used with its unpremultiplied channels, so the expression is the CSS 
+    #  equivalent of @ref over.
+    #
+    #  @param other A Color, hexadecimal string or rgba list or tuple to be mixed with.
+    #  @param percentage The amount, between [0,100], of the color in the mix. If omitted, the 
+    #  color's own alpha is used (e.g., 50% for a = 0.5).
+    #  @return A string in the format "color-mix(in srgb, #RRGGBB X%, #RRGGBB)".
+    #  @exception TypeError Raised if other is not a: class Color, a list, tuple or string.
+    def as_color_mix(self, other: Union['Color', str, list, tuple], percentage: Union[float, None] = None) -> str:
+        if (not isinstance(other, Color)):
+            other = Color(other)
+        
+        color = self.hex
+        if (percentage is None):
+            percentage = self._a * 100
+            if (0 < self._a < 1):
+                color = "#" + bytes((min(255, round(self._r / self._a)),
+                                     min(255, round(self._g / self._a)),
+                                     min(255, round(self._b / self._a)))).hex()
+        
+        return f"color-mix(in srgb, {color} {percentage:g}%, {other.hex})"